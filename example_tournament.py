@@ -14,7 +14,10 @@ def run_tournament():
         tilewe.engine.RandomEngine(),
     ])
 
-    results = tournament.play(100, n_threads=multiprocessing.cpu_count(), move_seconds=15)
+    results = tournament.play(100, n_threads=multiprocessing.cpu_count(), move_seconds=15, keep_boards=True)
+
+    # worker processes are kept for further games until they're stopped
+    tournament.stop_workers()
 
     # print the result of game 1
     print(results.match_data[0].board)
@@ -1,5 +1,7 @@
 from collections import defaultdict
 from dataclasses import dataclass
+from typing import Iterator
+import random
 import sys
 
 import numpy as np 
@@ -429,6 +431,14 @@ _PRP_WITH_PC_ID: dict[int, _PrpSet] = defaultdict(_PrpSet)
 for _pt in _PIECE_ROTATION_POINTS: 
     _PRP_WITH_PC_ID[_pt.piece_id] |= _pt.as_set
 
+# random keys for incrementally hashing board positions, see Board.zobrist
+# seeded so that hashes are the same across processes and runs 
+_zobrist_rng = random.Random(0x71E7E)
+_ZOBRIST_TILES: list[list[int]] = [[_zobrist_rng.getrandbits(64) for _ in range(400)] for _ in COLORS]
+_ZOBRIST_PIECES: list[list[int]] = [[_zobrist_rng.getrandbits(64) for _ in range(PIECE_COUNT)] for _ in COLORS]
+_ZOBRIST_TURN: list[int] = [_zobrist_rng.getrandbits(64) for _ in COLORS]
+_ZOBRIST_N_PLAYERS: list[int] = [_zobrist_rng.getrandbits(64) for _ in range(len(COLORS) + 1)]
+
 def tile_to_coords(tile: Tile) -> tuple[int, int]: 
     return tile 
 
@@ -478,12 +488,15 @@ class _PlayerState:
         Whether or not the player has made a move yet
     score : int
         The player's current score in the active game
+    n_moves : int | None
+        The player's cached unique legal move count, or None if not computed
     """
 
     prps: _PrpSet
     corners: dict[Tile, _PrpSet]
     has_played: bool
     score: int
+    n_moves: int | None
 
     def copy(self) -> '_PlayerState': 
         out = _PlayerState.__new__(_PlayerState) 
@@ -491,6 +504,7 @@ class _PlayerState:
         out.corners = dict(self.corners)
         out.has_played = self.has_played 
         out.score = self.score 
+        out.n_moves = self.n_moves 
 
         return out 
 
@@ -517,6 +531,7 @@ class _Player:
         self.corners: dict[Tile, _PrpSet] = {}
         self.has_played = False 
         self.score = 0
+        self._n_moves: int = None
         self._state: list[_PlayerState] = []
 
         # add the 4 initial corners of the board at game start
@@ -535,19 +550,40 @@ class _Player:
         out.corners = dict(self.corners)
         out.has_played = self.has_played 
         out.score = self.score
+        out._n_moves = self._n_moves 
         out._state = [] 
 
         return out 
 
+    def copy_current_state_into(self, out: '_Player') -> None: 
+        out._prps = self._prps 
+        out.corners.clear() 
+        out.corners.update(self.corners) 
+        out.has_played = self.has_played 
+        out.score = self.score
+        out._n_moves = self._n_moves 
+        out._state.clear() 
+
     @property 
     def can_play(self) -> bool: 
         return len(self.corners) > 0 
 
+    @property 
+    def n_unique_moves(self) -> int: 
+        # cached until the open corners change, since most moves
+        # leave the corners of at least some of the players untouched
+        if self._n_moves is None: 
+            total = 0 
+            for prps in self.corners.values(): 
+                total += prps.bit_count() 
+            self._n_moves = total 
+        return self._n_moves 
+
     def push_state(self) -> None: 
         prps = self._prps 
         corners = dict(self.corners) 
 
-        self._state.append(_PlayerState(prps, corners, self.has_played, self.score))
+        self._state.append(_PlayerState(prps, corners, self.has_played, self.score, self._n_moves))
 
     def pop_state(self) -> bool: 
         state = self._state.pop() 
@@ -556,6 +592,7 @@ class _Player:
         self.corners = state.corners 
         self.has_played = state.has_played
         self.score = state.score 
+        self._n_moves = state.n_moves 
 
     def remove_piece(self, piece_id: int) -> None: 
         # remove piece permutations from availability list 
@@ -576,10 +613,15 @@ class _Player:
         for r in remove: 
             del self.corners[r]
 
+        self._n_moves = None 
+
     def on_tiles_filled(self, tiles: list[Tile]) -> None: 
+        changed = False 
+
         # if an open corner was filled, no player can use it anymore
         for tile in tiles: 
-            self.corners.pop(tile, None) 
+            if self.corners.pop(tile, None) is not None: 
+                changed = True 
 
         remove = []
 
@@ -591,6 +633,9 @@ class _Player:
             for tile in tiles: 
                 rel = (tile[0] - corner[0], tile[1] - corner[1]) 
                 invalid |= _PRP_WITH_REL_COORD[rel]
+            if (prps & invalid) == 0: 
+                continue 
+            changed = True 
             prps &= ~invalid 
             if prps == 0: 
                 remove.append(corner) 
@@ -600,6 +645,9 @@ class _Player:
         for r in remove: 
             del self.corners[r]
 
+        if changed: 
+            self._n_moves = None 
+
     def add_corner(self, tile: Tile) -> None:
         if tile in self.corners or out_of_bounds(tile):
             return
@@ -617,6 +665,7 @@ class _Player:
         prps = self._prps & ~bad
         if prps > 0:
             self.corners[tile] = self._prps & ~bad
+            self._n_moves = None 
 
 class Move:
     """
@@ -694,10 +743,13 @@ class _BoardState:
         Which player's turn it is in the game
     tiles : list[Tile]
         The list of all Tile objects on the board
+    zobrist : int
+        The board's Zobrist hash of placed pieces, excluding the turn
     """
 
     cur_player: int
     tiles: list[Tile]
+    zobrist: int
 
 class Board: 
     """
@@ -732,12 +784,14 @@ class Board:
         self.finished = False 
         self.ply = 0 
         self.moves: list[Move] = []
+        self._zobrist = _ZOBRIST_N_PLAYERS[n_players]
 
     def copy_current_state(self) -> 'Board': 
         out = Board.__new__(Board) 
         out._state = [] 
         out._tiles = np.copy(self._tiles)
         out._n_players = self._n_players 
+        out._zobrist = self._zobrist 
         out._players = [p.copy_current_state(out) for p in self._players]
         out.current_player = self.current_player
         out.finished = self.finished 
@@ -746,10 +800,62 @@ class Board:
 
         return out 
 
+    def copy_current_state_into(self, out: 'Board') -> 'Board': 
+        """
+        Same as copy_current_state, but overwrites an existing board with the same 
+        number of players instead of allocating a new one, e.g. to reuse one scratch 
+        board for every search of a game. Returns `out`. 
+        """
+        if out._n_players != self._n_players: 
+            raise Exception("Can only copy the board state into a board with the same number of players") 
+
+        np.copyto(out._tiles, self._tiles) 
+        out._state.clear() 
+        out._zobrist = self._zobrist 
+        for player, out_player in zip(self._players, out._players): 
+            player.copy_current_state_into(out_player) 
+        out.current_player = self.current_player
+        out.finished = self.finished 
+        out.ply = self.ply 
+        out.moves.clear() 
+
+        return out 
+
+    def to_bytes(self) -> bytes: 
+        """
+        Returns a compact encoding of the game from the number of players and the 
+        moves played so far, for sending boards between processes or storing them. 
+        Null moves aren't recorded. See Board.from_bytes. 
+        """
+        moves = np.array([
+            (m.piece, m.rotation, tile_to_index(m.contact), tile_to_index(m.to_tile)) 
+            for m in self.moves
+        ], dtype='<u2').reshape(-1, 4)
+        return bytes([self._n_players]) + moves.tobytes()
+
+    @staticmethod
+    def from_bytes(data: bytes) -> 'Board': 
+        """
+        Returns a new board with the game encoded by Board.to_bytes replayed on it. 
+        """
+        board = Board(data[0])
+        for piece, rotation, contact, to_tile in np.frombuffer(data, dtype='<u2', offset=1).reshape(-1, 4).tolist(): 
+            board.push(Move(piece, rotation, TILES[contact], TILES[to_tile]))
+        return board 
+
     @property
     def n_players(self) -> int: 
         return self._n_players 
 
+    @property
+    def zobrist(self) -> int: 
+        """
+        64-bit Zobrist hash of the position, i.e. the pieces placed by each
+        player and whose turn it is. Positions reached by different move
+        orders share a hash, so it can be used to key transposition tables.
+        """
+        return self._zobrist ^ _ZOBRIST_TURN[self.current_player]
+
     @property 
     def scores(self) -> list[int]: 
         return [p.score for p in self._players] 
@@ -846,8 +952,7 @@ class Board:
         total = 0 
 
         if unique: 
-            for prps in player.corners.values(): 
-                total += prps.bit_count() 
+            total = player.n_unique_moves 
         else: 
             for prps in player.corners.values(): 
                 while prps != 0: 
@@ -863,13 +968,18 @@ class Board:
 
         return total 
 
-    def generate_legal_moves(self, unique: bool=True, for_player: Color=None): 
+    def generate_legal_moves(self, unique: bool=True, for_player: Color=None, to_tile: Tile=None): 
+        """
+        Returns the legal moves of the current player, or `for_player` if given. 
+        If `to_tile` is given, only moves played at that open corner are generated. 
+        """
         moves: list[Move] = [] 
         player = self._players[self.current_player if for_player is None else for_player]
+        corners = player.corners.items() if to_tile is None else self._tile_corners(player, to_tile)
 
         # duplicate for loop so that we don't check the if statement for every permutation
         if unique: 
-            for to_sq, prps in player.corners.items(): 
+            for to_sq, prps in corners: 
                 while prps != 0: 
                     # get least significant bit
                     prp_id = (prps & -prps).bit_length() - 1
@@ -885,7 +995,7 @@ class Board:
                         to_sq
                     ))
         else: 
-            for to_sq, prps in player.corners.items(): 
+            for to_sq, prps in corners: 
                 while prps != 0: 
                     # get least significant bit
                     prp_id = (prps & -prps).bit_length() - 1
@@ -905,8 +1015,48 @@ class Board:
                 
         return moves 
 
+    def iter_legal_moves(self, unique: bool=True, for_player: Color=None, to_tile: Tile=None) -> Iterator[Move]: 
+        """
+        Yields the same moves as generate_legal_moves without building a list of them, 
+        for callers that only need a single pass over the legal moves. The board must 
+        not be modified until iteration finishes. 
+        """
+        player = self._players[self.current_player if for_player is None else for_player]
+        corners = player.corners.items() if to_tile is None else self._tile_corners(player, to_tile)
+
+        # duplicate for loop so that we don't check the if statement for every permutation
+        if unique: 
+            for to_sq, prps in corners: 
+                while prps != 0: 
+                    # get least significant bit
+                    prp_id = (prps & -prps).bit_length() - 1
+                    # remove it so the next LSB is another PRP
+                    prps ^= 1 << prp_id
+
+                    prp = _PIECE_ROTATION_POINTS[prp_id]
+
+                    yield Move(prp.piece.id, prp.rotation.rotation, prp.contact, to_sq)
+        else: 
+            for to_sq, prps in corners: 
+                while prps != 0: 
+                    # get least significant bit
+                    prp_id = (prps & -prps).bit_length() - 1
+                    # remove it so the next LSB is another PRP
+                    prps ^= 1 << prp_id
+
+                    prp = _PIECE_ROTATION_POINTS[prp_id]
+
+                    # include permutations with non-unique rotations/flips
+                    for rot in prp.piece.true_rot_for[prp.rotation.rotation]: 
+                        yield Move(prp.piece.id, rot, prp.contact, to_sq)
+
+    def _tile_corners(self, player: _Player, to_tile: Tile) -> list[tuple[Tile, int]]: 
+        # the moves at a single open corner, or none if it isn't one
+        prps = player.corners.get(to_tile)
+        return [] if prps is None else [(to_tile, prps)]
+
     def push_null(self) -> None: 
-        self._state.append(_BoardState(self._incr_player(), None))
+        self._state.append(_BoardState(self._incr_player(), None, self._zobrist))
 
     def pop_null(self) -> None: 
         state = self._state.pop() 
@@ -932,6 +1082,7 @@ class Board:
         self.current_player = state.cur_player 
         self.finished = False 
         self.ply -= 1 
+        self._zobrist = state.zobrist 
 
         # player state is stored per player 
         for player in self._players: 
@@ -960,6 +1111,7 @@ class Board:
         self.moves.append(move) 
 
         player = self._players[self.current_player]
+        zobrist = self._zobrist 
 
         for p in self._players: 
             p.push_state() 
@@ -972,8 +1124,11 @@ class Board:
         for abs_tile in corners: 
             player.add_corner(abs_tile) 
 
+        tile_keys = _ZOBRIST_TILES[self.current_player]
+        self._zobrist ^= _ZOBRIST_PIECES[self.current_player][prp.piece_id]
         for abs_tile in tiles: 
             self._tiles[abs_tile] = self.current_player + 1
+            self._zobrist ^= tile_keys[abs_tile[0] * 20 + abs_tile[1]]
 
         for p in self._players: 
             p.on_tiles_filled(tiles) 
@@ -987,6 +1142,7 @@ class Board:
             player.corners.pop(A20, None)
             player.corners.pop(T01, None)
             player.corners.pop(T20, None)
+            player._n_moves = None 
 
         player.has_played = True 
         player.score += len(prp.tiles)
@@ -994,10 +1150,11 @@ class Board:
         # inc turn and make sure player can move 
         cur_turn = self._incr_player() 
 
-        self._state.append(_BoardState(cur_turn, tiles))
+        self._state.append(_BoardState(cur_turn, tiles, zobrist))
 
     def __str__(self): 
-        out = "" 
+        # pieces of the output are joined once at the end
+        out: list[str] = []
         
         board = self._tiles[::-1]
 
@@ -1020,31 +1177,28 @@ class Board:
             ]
 
         for y in range(20): 
-            for x in range(20): 
-                out += f"{chars[board[y,x]]} "
-            out += "\n"
+            out.append(" ".join([chars[tile] for tile in board[y].tolist()]))
+            out.append(" \n")
 
         for player in self._players: 
-            out += f"{player.name}: {int(player.score)} "
+            out.append(f"{player.name}: {int(player.score)} ")
 
             pcs = [_PIECES[pc] for pc in self._remaining_piece_set(player.id)]
 
             if len(pcs) > 0: 
                 pcs = sorted(pcs, key=lambda x: x.id) 
 
-                out += "( "
-                for pc in pcs: 
-                    out += pc.name + " " 
-                out += ")\n"
+                out.append("( ")
+                out.extend([pc.name + " " for pc in pcs])
+                out.append(")\n")
             else:
-                out += "( )\n"
+                out.append("( )\n")
 
-        out += f"Finished: {self.finished}"
+        out.append(f"Finished: {self.finished}")
         if self.finished: 
-            out += "\nWinner: "
-            for p in self.winners: 
-                out += f"{self._players[p].name} "
+            out.append("\nWinner: ")
+            out.extend([f"{self._players[p].name} " for p in self.winners])
         else: 
-            out += f"\nTurn: {self._players[self.current_player].name}"
+            out.append(f"\nTurn: {self._players[self.current_player].name}")
 
-        return out 
+        return "".join(out) 
@@ -0,0 +1,106 @@
+import numpy as np
+
+import tilewe
+
+# Kernels for the sample engines that read a board's internal legal move sets directly.
+# Candidate moves stay as placement ids (piece-rotation-points) and tile indices in
+# NumPy arrays, and only the chosen move is ever turned into a tilewe.Move.
+
+N_PLACEMENTS = len(tilewe._PIECE_ROTATION_POINTS)
+_SET_BYTES = (N_PLACEMENTS + 7) // 8
+
+# maps a board tile index (y * 20 + x) to a tile weight index (x * 20 + y), see TileWeightEngine
+TILE_TO_WEIGHT_INDEX = np.arange(20 * 20, dtype=np.intp).reshape(20, 20).T.ravel()
+
+def placement_id(piece: tilewe.Piece, rotation: tilewe.Rotation, contact: tilewe.Tile) -> int:
+    """
+    Returns the id of a piece placement relative to its contact tile. Rotations
+    that result in the same shape share the id of the unique rotation.
+    """
+    return tilewe._PIECES[piece].rotations[rotation].prps[contact].id
+
+def placement_move(placement: int, tile_index: int) -> tilewe.Move:
+    """
+    Returns the unique Move that plays the placement with its contact at the tile index.
+    """
+    prp = tilewe._PIECE_ROTATION_POINTS[placement]
+    return tilewe.Move(prp.piece_id, prp.rotation.rotation, prp.contact, tilewe.TILES[tile_index])
+
+def legal_placements(
+    board: tilewe.Board,
+    for_player: tilewe.Color=None,
+    to_tile: tilewe.Tile=None
+) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Returns the unique legal moves of a player as arrays of placement ids and the
+    board tile indices they are played at, in the same order as Board.generate_legal_moves.
+
+    Parameters
+    ----------
+    board : tilewe.Board
+        The board to get moves from
+    for_player : tilewe.Color
+        The player to get moves for, defaults to the current player
+    to_tile : tilewe.Tile
+        Optionally only get moves played at this open corner
+
+    Returns
+    -------
+    placements : np.ndarray
+        The placement id of each move
+    tile_indices : np.ndarray
+        The board tile index of each move's open corner
+    """
+
+    player = board._players[board.current_player if for_player is None else for_player]
+    corners = player.corners.items() if to_tile is None else board._tile_corners(player, to_tile)
+
+    placements = [np.zeros(0, dtype=np.intp)]
+    tile_indices = [np.zeros(0, dtype=np.intp)]
+    for tile, prps in corners:
+        # unpack the set bits of the corner's placement set all at once
+        found = np.flatnonzero(np.unpackbits(
+            np.frombuffer(prps.to_bytes(_SET_BYTES, 'little'), dtype=np.uint8), bitorder='little'))
+        placements.append(found)
+        tile_indices.append(np.full(len(found), tilewe.tile_to_index(tile)))
+
+    return np.concatenate(placements), np.concatenate(tile_indices)
+
+def _weight_offset_table() -> np.ndarray:
+    offsets = [
+        [c[1] * 20 + c[0] for c in prp.tiles]
+        for prp in tilewe._PIECE_ROTATION_POINTS
+    ]
+    table = np.full((N_PLACEMENTS, max(len(row) for row in offsets)), 20 * 20, dtype=np.intp)
+    for i, row in enumerate(offsets):
+        table[i, :len(row)] = row
+    return table
+
+# tile weight indices covered by each placement relative to the weight index of its contact tile,
+# one row per placement id, with rows of pieces smaller than the largest piece padded past the
+# end of the 400 weights, see padded_weights
+WEIGHT_OFFSETS = _weight_offset_table()
+
+def padded_weights(weights: list[int | float]) -> np.ndarray:
+    """
+    Returns the 400 tile weights followed by enough 0s that the padded entries of
+    WEIGHT_OFFSETS index a 0 from any contact tile, so they need no masking.
+    """
+    padded = np.zeros(2 * 20 * 20, dtype=np.asarray(weights).dtype)
+    padded[:20 * 20] = weights
+    return padded
+
+def tile_weight_scores(
+    weights: np.ndarray,
+    offset_table: np.ndarray,
+    placements: np.ndarray,
+    to_indices: np.ndarray
+) -> np.ndarray:
+    """
+    Returns the total weight of the tiles covered by each move. Moves are given as
+    their placement ids and the weight index of their contact tile. `weights` must
+    come from padded_weights.
+    """
+
+    # one gather for every tile of every move and a row sum, padded tiles add 0
+    return weights[offset_table[placements] + to_indices[:, None]].sum(axis=1)
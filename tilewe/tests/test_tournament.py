@@ -0,0 +1,150 @@
+import multiprocessing
+import unittest
+
+import tilewe
+import tilewe.engine
+import tilewe.tournament
+
+class TestTilewe(unittest.TestCase):
+
+    def test_tournament_results(self):
+        tournament = tilewe.tournament.Tournament([
+            tilewe.engine.RandomEngine("Random 1"),
+            tilewe.engine.RandomEngine("Random 2"),
+            tilewe.engine.LargestPieceEngine(),
+        ])
+        results = tournament.play(
+            4, n_threads=2, players_per_game=2, move_seconds=5, verbose_rankings=False, keep_boards=True)
+        tournament.stop_workers()
+
+        self.assertEqual(results.total_games, 4)
+        self.assertEqual(results.total_engines, 3)
+        self.assertEqual(sum(results.game_counts), 4 * 2)
+        self.assertEqual(sum(results.total_scores), sum(sum(m.board.scores) for m in results.match_data))
+        self.assertEqual(results.match_scores.sum(axis=0).tolist(), results.total_scores)
+        self.assertEqual(results.match_winners.sum(axis=0).tolist(), results.win_counts)
+        self.assertEqual(results.match_run_times.tolist(), [m.run_time for m in results.match_data])
+
+        for match in results.match_data:
+            self.assertTrue(match.board.finished)
+            self.assertEqual(match.final_scores, tuple(match.board.scores))
+            self.assertEqual(len(match.engines), 2)
+            for engine in match.engines:
+                self.assertIn(match, results.get_matches_by_engine(engine))
+
+        for engine in range(results.total_engines):
+            self.assertEqual(len(results.get_matches_by_engine(engine)), results.game_counts[engine])
+        self.assertEqual(results.get_matches_by_engine(-1), [])
+        self.assertEqual(results.get_matches_by_engine(results.total_engines), [])
+
+        # results are read only
+        with self.assertRaises(AttributeError):
+            results.real_time = 0.0
+
+    def test_tournament_untrusted_engines(self):
+        tournament = tilewe.tournament.Tournament([
+            tilewe.engine.RandomEngine(),
+            tilewe.engine.TileWeightEngine(),
+        ], trust_engines=False)
+        results = tournament.play(2, n_threads=1, players_per_game=2, move_seconds=5, verbose_rankings=False)
+
+        # a single thread plays in this process without starting workers
+        self.assertIsNone(tournament._pool)
+        self.assertEqual(results.total_games, 2)
+        self.assertEqual(results.game_counts, [2, 2])
+
+        # boards aren't kept by default
+        for match in results.match_data:
+            self.assertIsNone(match.board)
+            self.assertEqual(len(match.final_scores), 2)
+
+    def test_tournament_fewer_engines_than_players(self):
+        tournament = tilewe.tournament.Tournament([
+            tilewe.engine.RandomEngine(),
+            tilewe.engine.LargestPieceEngine(),
+        ])
+        results = tournament.play(2, n_threads=1, move_seconds=5, verbose_rankings=False)
+
+        self.assertEqual(results.total_games, 2)
+        self.assertEqual(results.game_counts, [2, 2])
+        for match in results.match_data:
+            self.assertEqual(len(match.elo_delta), 2)
+
+    def test_tournament_single_player(self):
+        tournament = tilewe.tournament.Tournament([
+            tilewe.engine.RandomEngine(),
+            tilewe.engine.LargestPieceEngine(),
+        ])
+        results = tournament.play(2, n_threads=1, players_per_game=1, move_seconds=5, verbose_rankings=False)
+
+        self.assertEqual(results.total_games, 2)
+        self.assertEqual(results.win_counts, results.game_counts)
+        self.assertEqual(results.elo_end, results.elo_start)
+        for match in results.match_data:
+            self.assertEqual(match.elo_delta, [0.0])
+
+    def test_tournament_seed(self):
+        def play(seed: int, n_threads: int) -> list[tuple[list[int], tuple[int, ...], int]]:
+            tournament = tilewe.tournament.Tournament([
+                tilewe.engine.RandomEngine(),
+                tilewe.engine.LargestPieceEngine(),
+                tilewe.engine.TileWeightEngine(),
+            ])
+            results = tournament.play(
+                4, n_threads=n_threads, players_per_game=2, move_seconds=5, verbose_rankings=False, seed=seed)
+            tournament.stop_workers()
+            # games finish in any order with several threads
+            return sorted((m.player_to_engine, m.final_scores, m.board_hash) for m in results.match_data)
+
+        self.assertEqual(play(17, 1), play(17, 2))
+
+    def test_tournament_reuses_workers(self):
+        tournament = tilewe.tournament.Tournament([
+            tilewe.engine.RandomEngine(),
+            tilewe.engine.LargestPieceEngine(),
+        ])
+        pool = tournament.start_workers(2)
+        results = tournament.play(2, n_threads=2, players_per_game=2, move_seconds=5, verbose_rankings=False)
+        results = tournament.play(2, n_threads=2, players_per_game=2, move_seconds=5, verbose_rankings=False)
+
+        self.assertIs(tournament._pool, pool)
+        self.assertEqual(results.total_games, 2)
+
+        tournament.stop_workers()
+        self.assertIsNone(tournament._pool)
+
+    def test_tournament_workers_play_different_games(self):
+        tournament = tilewe.tournament.Tournament([
+            tilewe.engine.RandomEngine("Random 1"),
+            tilewe.engine.RandomEngine("Random 2"),
+        ])
+        results = tournament.play(8, n_threads=4, players_per_game=2, move_seconds=5, verbose_rankings=False)
+        tournament.stop_workers()
+
+        # unseeded workers don't share the engines' random choices
+        self.assertEqual(len({m.board_hash for m in results.match_data}), 8)
+
+    def test_tournament_replaces_workers(self):
+        tournament = tilewe.tournament.Tournament([
+            tilewe.engine.RandomEngine(),
+            tilewe.engine.LargestPieceEngine(),
+        ], max_tasks_per_child=1)
+        results = tournament.play(4, n_threads=2, players_per_game=2, move_seconds=5, verbose_rankings=False)
+        tournament.stop_workers()
+
+        self.assertEqual(results.total_games, 4)
+        self.assertEqual(results.game_counts, [4, 4])
+
+    @unittest.skipUnless("forkserver" in multiprocessing.get_all_start_methods(), "forkserver is unavailable")
+    def test_tournament_start_method(self):
+        tournament = tilewe.tournament.Tournament([
+            tilewe.engine.RandomEngine(),
+            tilewe.engine.LargestPieceEngine(),
+        ], start_method="forkserver")
+        results = tournament.play(2, n_threads=2, players_per_game=2, move_seconds=5, verbose_rankings=False)
+        tournament.stop_workers()
+
+        self.assertEqual(results.total_games, 2)
+
+if __name__ == '__main__':
+    unittest.main()
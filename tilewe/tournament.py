@@ -1,47 +1,68 @@
 from dataclasses import dataclass, field
+import heapq
 import multiprocessing
+import multiprocessing.pool
 import traceback
 import platform
-import random
 import signal
 import time
+import zlib
+
+import numpy as np 
 
 import tilewe 
 from tilewe.engine import Engine
 from tilewe.elo import compute_elo_adjustment_n
 
-@dataclass
+@dataclass(slots=True)
 class MatchData:
     """
     The data from a single match of Tilewe.
 
     Parameters
     ----------
-    board : tilewe.Board
-        A reference to the final board state of the game
     engines : list[int]
         List of the engines that played in the game
     player_to_engine : list[int]
         Ordered list that maps index as player turn order to engine at that turn order
     run_time : float
         The duration of this match in seconds
+    final_scores : tuple[int, ...]
+        The final score of each player in turn order
+    board_hash : int
+        A fingerprint of the moves of the game, the same for identical games
     elo_start : list[float] | None
         Player Elos before this match
     elo_delta : list[float] | None
         Change in player Elos as a result of this match
     elo_end : list[float] | None
         Player Elos after this match
+    board_data : bytes | None
+        The final board state of the game encoded by tilewe.Board.to_bytes, which 
+        `board` decodes the first time it's used, or None if boards weren't kept
     """
 
-    board: tilewe.Board
     engines: list[int]
     player_to_engine: list[int]
     run_time: float
+    final_scores: tuple[int, ...] = ()
+    board_hash: int = 0
     elo_start: list[float] = field(default_factory=list)
     elo_delta: list[float] = field(default_factory=list)
     elo_end: list[float] = field(default_factory=list)
+    board_data: bytes = field(default=None, repr=False)
+    _board: tilewe.Board = field(default=None, init=False, repr=False, compare=False)
+
+    @property
+    def board(self) -> tilewe.Board | None: 
+        """
+        The final board state of the game, or None if the tournament didn't keep boards
+        """
+        if self._board is None and self.board_data is not None: 
+            self._board = tilewe.Board.from_bytes(self.board_data)
+        return self._board
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class TournamentResults:
     """
     The data set generated by an instance of Tournament.play.
@@ -67,6 +88,13 @@ class TournamentResults:
         The real run time of the tournament in seconds
     total_time : float
         The total run time of all the individual games in seconds
+    match_scores : np.ndarray
+        Score of each engine (columns) in each match (rows), 0 if it didn't play, 
+        in the same order as `match_data`
+    match_winners : np.ndarray
+        Whether each engine (columns) won each match (rows)
+    match_run_times : np.ndarray
+        The duration of each match in seconds
     """
 
     match_data: list[MatchData]
@@ -78,6 +106,10 @@ class TournamentResults:
     elo_end: list[float]
     real_time: float
     total_time: float
+    match_scores: np.ndarray = field(default=None, repr=False)
+    match_winners: np.ndarray = field(default=None, repr=False)
+    match_run_times: np.ndarray = field(default=None, repr=False)
+    _matches_by_engine: list[list[int]] = field(default=None, init=False, repr=False, compare=False)
     
     @property
     def total_games(self) -> int:
@@ -89,19 +121,28 @@ class TournamentResults:
 
     @property
     def win_rates(self) -> list[float]: 
-        return [self.win_counts[i] / max(1, self.game_counts[i]) for i in range(self.total_engines)]
+        return (np.asarray(self.win_counts) / np.maximum(1, self.game_counts)).tolist()
     
     @property
     def avg_scores(self) -> list[float]: 
-        return [self.total_scores[i] / max(1, self.game_counts[i]) for i in range(self.total_engines)]
+        return (np.asarray(self.total_scores) / np.maximum(1, self.game_counts)).tolist()
 
     @property
     def average_match_duration(self) -> float:
         return self.total_time / max(1, self.total_games)
     
     def get_matches_by_engine(self, engine: int) -> list[MatchData]:
-        filtered_matches = [x for x in self.match_data if engine in x.engines]
-        return filtered_matches
+        # engines that aren't in the tournament played no matches
+        if not 0 <= engine < self.total_engines: 
+            return []
+        if self._matches_by_engine is None: 
+            # indices of the matches each engine played in, built on first lookup
+            matches: list[list[int]] = [[] for _ in range(self.total_engines)]
+            for index, match in enumerate(self.match_data):
+                for engine_index in match.engines:
+                    matches[engine_index].append(index)
+            object.__setattr__(self, '_matches_by_engine', matches)
+        return [self.match_data[i] for i in self._matches_by_engine[engine]]
     
     def get_game_count_by_engine(self, engine: int) -> int:
         return self.game_counts[engine]
@@ -138,20 +179,11 @@ class TournamentResults:
         if sort_dir != 'asc' and sort_dir != 'desc':
             return f"Invalid sort direction '{sort_dir}', try 'asc' or 'desc'"
 
-        out = f"Ranking by {sort_by} {sort_dir}:\n"
-        out += f"{'Rank':4} {'Name':24} {'Elo':>5} {'Games':>6} {'Score':>10} {'Avg Score':>10} {'Wins':>6} {'Win Rate':>9}\n"
         dir = -1 if sort_dir == 'desc' else 1
-        ranked_engines = sorted(range(len(self.engine_names)), key=lambda x: dir * sort_attr[x])
-        for rank, engine in enumerate(ranked_engines):
-            name = self.engine_names[engine]
-            wins, games = self.win_counts[engine], self.game_counts[engine]
-            score, elo = self.total_scores[engine], self.elo_end[engine]
-
-            win_rate = f"{(wins / games * 100):>8.2f}%" if games > 0 else f"{'-':>9}"
-            avg_score = f"{(score / games):>10.2f}" if games > 0 else f"{'-':>10}"
-
-            out += f"{rank:>4d} {name:24.24} {elo:>5.0f} {games:>6d} {score:>10d} {avg_score} {wins:>6d} {win_rate}\n"
-        return out
+        ranked_engines = np.argsort(dir * np.asarray(sort_attr), kind='stable')
+        lines = _format_engine_rankings(
+            ranked_engines, self.engine_names, self.elo_end, self.game_counts, self.total_scores, self.win_counts)
+        return f"Ranking by {sort_by} {sort_dir}:\n" + "\n".join(lines) + "\n"
 
 class Tournament: 
     """
@@ -161,6 +193,10 @@ class Tournament:
     win/score results after each game completes. Currently does
     not enforce time controls, but Engines should follow them anyways.
 
+    The worker processes and their copies of the engines are kept between 
+    calls to `play`, until `stop_workers` is called or the thread count changes.
+    They can also be started ahead of time with `start_workers`.
+
     Example
     -------
     >>> tournament = tilewe.tournament.Tournament([
@@ -172,7 +208,14 @@ class Tournament:
     >>> tournament.play(1000, n_threads=multiprocessing.cpu_count(), move_seconds=15)
     """
 
-    def __init__(self, engines: list[Engine], move_seconds: int=60):
+    def __init__(
+        self, 
+        engines: list[Engine], 
+        move_seconds: int=60, 
+        trust_engines: bool=True, 
+        max_tasks_per_child: int=None, 
+        start_method: str=None
+    ):
         """
         Parameters
         ----------
@@ -182,16 +225,37 @@ class Tournament:
             The list of engines to play in the games (at least 1)
         move_seconds : int=60
             The default time control if `play` doesn't override it
+        trust_engines : bool=True
+            Whether engines search the game board directly, which they must leave as they
+            found it (e.g. by popping every move they push), or a copy of it each turn
+        max_tasks_per_child : int=None
+            Optionally replace each worker process with a fresh one, with fresh copies of the 
+            engines, after it plays this many chunks of games, to release memory held by 
+            engines that grow over long tournaments
+        start_method : str=None
+            Optional multiprocessing start method for the workers, otherwise the platform default.
+            'forkserver' starts workers from a server process that has already imported tilewe,
+            so new workers don't import it again or inherit copy-on-write memory from a possibly
+            large parent process. Like 'spawn', it requires the engines to be importable from the
+            main module and the tournament to be run under `if __name__ == '__main__':`
         """
         
         if (len(engines) < 1):
             raise Exception("Number of engines must be greater than 0")
         if move_seconds <= 0:
             raise Exception("Must allow greater than 0 seconds per move")
+        if max_tasks_per_child is not None and max_tasks_per_child <= 0:
+            raise Exception("Workers must play at least one task before being replaced")
         
-        self.engines = list(engines)
+        self.engines: tuple[Engine, ...] = tuple(engines)
         self._seconds = move_seconds
         self.move_seconds = self._seconds
+        self.trust_engines = trust_engines
+        self.max_tasks_per_child = max_tasks_per_child
+        self.start_method = start_method
+
+        self._pool: multiprocessing.pool.Pool = None
+        self._pool_threads = 0
 
     def play(
         self,
@@ -200,7 +264,10 @@ class Tournament:
         players_per_game: int=4,
         move_seconds: int=None,
         verbose_board: bool=False,
-        verbose_rankings: bool=True
+        verbose_games: bool=True,
+        verbose_rankings: bool=True,
+        seed: int=None,
+        keep_boards: bool=False
     ):
         """
         Used to launch a series of games in an initialized Tournament.
@@ -210,15 +277,25 @@ class Tournament:
         n_games : int
             The number of games to play
         n_threads : int=1
-            The number of simultaneous games to multiprocess
+            The number of simultaneous games to multiprocess, with 1 playing the games 
+            one at a time in this process instead
         players_per_game : int=4
             The amount of players to have in each game, from 1 to 4
         move_seconds : int=60
             Optional override for the time control for these games
         verbose_board : bool=False
             Whether or not to print the final board state of each match
+        verbose_games : bool=True
+            Whether or not to print the players, scores, and winners of each match
         verbose_rankings : bool=True
             Whether or not to print periodic ranking updates and the final rankings at the end
+        seed : int=None
+            Optional seed for the turn orders and each engine's `rng` in every game, which also
+            resets the engines before each game (see Engine.reset). This makes the games 
+            reproducible for any `n_threads`, as long as the engines don't depend on timing
+        keep_boards : bool=False
+            Whether each match keeps its final board, otherwise matches only keep
+            a summary of the game (e.g. `final_scores` and `board_hash`)
         """
 
         if n_games <= 0:
@@ -235,115 +312,154 @@ class Tournament:
         # initialize trackers and game controls
         N = len(self.engines)
         total_games = 0
-        wins = [0 for _ in range(N)]
-        games = [0 for _ in range(N)]
-        elos = [0 for _ in range(N)]
-        totals = [0 for _ in range(N)]
+        wins = np.zeros(N, dtype=np.int64)
+        games = np.zeros(N, dtype=np.int64)
+        elos = np.zeros(N, dtype=np.float64)
+        totals = np.zeros(N, dtype=np.int64)
 
-        initial_elos = [i for i in elos]
+        initial_elos = elos.tolist()
         match_results: list[MatchData] = []
-
-        # helper for getting engine rank summaries
+        match_scores: list[list[int]] = []
+        match_winners: list[list[int]] = []
+        # games have fewer players than requested when there aren't enough engines
+        game_size = min(N, players_per_game)
+        delta_buffer = np.zeros(game_size, dtype=np.float64)
+
+        # rows of the periodic rankings are only reformatted for engines that played since they were last shown
+        names = [engine.name for engine in self.engines]
+
+        # per match output is filled into a template built once, with each name already padded to its column
+        game_template = "Game %%%dd: %%-%ds  Scores: %%s  Winner(s): %%s" % (len(str(n_games)), game_size * 15)
+        name_columns = [f"{name:14.14}" for name in names]
+        rows: list[str] = [""] * N
+        dirty = np.ones(N, dtype=bool)
+
+        # helper for getting the periodic summaries of the top ranked engines
         def get_engine_rankings() -> str:
-            out = f"\n{'Rank':4} {'Name':24} {'Elo':>5} {'Games':>6} {'Score':>10} "
-            out += f"{'Avg Score':>10} {'Wins':>6} {'Win Rate':>9}\n"
-            ranked_engines = sorted(range(N), key=lambda x: -elos[x])
-            for rank, engine in enumerate(ranked_engines):
-                name = self.engines[engine].name
-                win_count, game_count = wins[engine], games[engine]
-                score, elo = totals[engine], elos[engine]
-                
-                win_rate = f"{(win_count / game_count * 100):>8.2f}%" if game_count > 0 else f"{'-':>9}"
-                avg_score = f"{(score / game_count):>10.2f}" if game_count > 0 else f"{'-':>10}"
-
-                out += f"{rank:>4d} {name:24.24} {elo:>5.0f} {game_count:>6d} {score:>10d} "
-                out += f"{avg_score} {win_count:>6d} {win_rate}\n"
-            return out
-
-        # prepare turn orders for the various games
-        args = [] 
-        for _ in range(n_games): 
-            order = list(range(N))
-            random.shuffle(order) 
-            args.append(order[:players_per_game]) 
+            ranked_engines = heapq.nlargest(_RANKINGS_TOP_K, range(N), key=elos.tolist().__getitem__)
+            lines = [_RANKINGS_HEADER]
+            for rank, engine in enumerate(ranked_engines): 
+                if dirty[engine]: 
+                    rows[engine] = _format_engine_row(engine, names, elos, games, totals, wins)
+                    dirty[engine] = False
+                lines.append(f"{rank:>4d} {rows[engine]}")
+            if N > len(ranked_engines): 
+                lines.append(f"{'':4} ... {N - len(ranked_engines)} more")
+            return "\n" + "\n".join(lines) + "\n"
+
+        # prepare turn orders and engine seeds for the various games,
+        # each order is the first players of a random permutation of the engines
+        rng = np.random.default_rng(seed)
+        orders = np.argsort(rng.random((n_games, N)), axis=1)[:, :players_per_game].tolist()
+        game_seeds = [None] * n_games if seed is None else rng.integers(1 << 63, size=n_games).tolist()
+        args = [(game_seed, self.move_seconds, order) for game_seed, order in zip(game_seeds, orders)]
 
         # play games with the given level of concurrency
         start_time = time.time()
         total_time = 0.0
 
-        if platform.system() == "Windows":
-            init_func, init_args = [None, None]
-        else:
-            init_func, init_args = [signal.signal, (signal.SIGINT, signal.SIG_IGN)]
-
-        with multiprocessing.Pool(n_threads, initializer=init_func, initargs=init_args) as pool: 
-            try:
-                for winners, scores, board, player_to_engine, time_sec in pool.imap_unordered(self._play_game, args): 
-                    if len(winners) > 0:  # at least one player always wins, if none then game crashed 
-                        total_games += 1 
-                        for p in player_to_engine:
-                            games[p] += 1
-                        for p in winners: 
-                            wins[p] += 1 
-                        for p, s in enumerate(scores): 
-                            totals[p] += s
-                        total_time += time_sec
-
-                        # get the names and scores for involved players
-                        game_players = [player_to_engine[i] for i in range(board.n_players)]
-                        player_names = [self.engines[i].name for i in game_players]
-                        player_scores = [scores[i] for i in game_players]
-                        winner_names = [self.engines[i].name for i in winners]
-                        
-                        # if there are enough players, compute elo changes
-                        if board.n_players > 1:
-                            player_elos = [elos[i] for i in game_players]
-                            delta_elos = compute_elo_adjustment_n(player_elos, player_scores)
-                            for index, player in enumerate(game_players):
-                                elos[player] += delta_elos[index]
-                            new_elos = [elos[i] for i in game_players]
-
-                        match_data = MatchData(
-                            board,
-                            game_players,
-                            player_to_engine,
-                            time_sec,
-                            player_elos,
-                            delta_elos,
-                            new_elos,
-                        )
-                        match_results.append(match_data)
-
-                        # output match results
-                        out_names = ' '.join([f"{i:14.14}" for i in player_names])
-                        print(f"Game {total_games:>{len(str(n_games))}}: {out_names:{board.n_players * 15}}  " + 
-                              f"Scores: {player_scores}  " + 
-                              f"Winner(s): {', '.join(winner_names)}")
-                        if verbose_board:
-                            print(board)
-                            print("")
-
-                        # output rankings summary every match chunk (or minimum 10 matches)
-                        if verbose_rankings and total_games % max(10, n_threads) == 0 and total_games != n_games:
-                            print(get_engine_rankings())
+        pool = None
+        if n_threads == 1: 
+            # a single game at a time is played in this process, skipping all the IPC
+            _init_worker(self.engines, self.trust_engines, False, False)
+            games_played = map(_play_game, args)
+        else: 
+            # games are dispatched in chunks to cut down on IPC round trips, the pool's result
+            # handler thread receives and unpickles finished games in the background and buffers 
+            # them for the loop below, so workers never wait on the aggregation and printing here
+            chunksize = max(1, n_games // (n_threads * 4))
+            pool = self.start_workers(n_threads)
+            games_played = pool.imap_unordered(_play_game, args, chunksize)
+
+        try:
+            for winners, scores, board_data, player_to_engine, time_sec in games_played: 
+                if len(winners) > 0:  # at least one player always wins, if none then game crashed 
+                    # get the scores for involved players
+                    game_players = list(player_to_engine)
+                    player_scores = [scores[i] for i in game_players]
+
+                    # engines appear at most once per game, so fancy indexing is safe without np.add.at,
+                    # and only the engines that played are touched rather than all of them
+                    total_games += 1 
+                    games[game_players] += 1
+                    dirty[game_players] = True
+                    wins[winners] += 1 
+                    totals[game_players] += player_scores
+                    total_time += time_sec
+                    
+                    # if there are enough players, compute elo changes, 
+                    # a lone player has no opponents so their elo is unchanged
+                    player_elos = elos[game_players].tolist()
+                    if len(game_players) > 1:
+                        compute_elo_adjustment_n(player_elos, player_scores, out=delta_buffer)
+                        elos[game_players] += delta_buffer
+                        delta_elos = delta_buffer.tolist()
+                        new_elos = elos[game_players].tolist()
                     else: 
-                        print("Game failed to terminate")
-
-            except KeyboardInterrupt:
+                        delta_elos = [0.0]
+                        new_elos = list(player_elos)
+
+                    match_data = MatchData(
+                        game_players,
+                        player_to_engine,
+                        time_sec,
+                        tuple(player_scores),
+                        zlib.crc32(board_data),
+                        player_elos,
+                        delta_elos,
+                        new_elos,
+                        board_data if keep_boards else None,
+                    )
+                    match_results.append(match_data)
+                    match_scores.append(scores)
+                    match_winners.append(winners)
+
+                    # output match results
+                    if verbose_games: 
+                        print(game_template % (
+                            total_games, 
+                            ' '.join([name_columns[i] for i in game_players]), 
+                            player_scores, 
+                            ', '.join([names[i] for i in winners])
+                        ))
+                    if verbose_board:
+                        print(tilewe.Board.from_bytes(board_data))
+                        print("")
+
+                    # output rankings summary every match chunk (or minimum 10 matches)
+                    if verbose_rankings and total_games % max(10, n_threads) == 0 and total_games != n_games:
+                        print(get_engine_rankings())
+                else: 
+                    print("Game failed to terminate")
+
+        except KeyboardInterrupt:
+            if pool is not None: 
                 print("Caught KeyboardInterrupt, terminating workers")
                 pool.terminate()
+                self._pool = None
+            else: 
+                print("Caught KeyboardInterrupt, stopping games")
+
+        # per match results for all the engines, as arrays with one row per match
+        scores_array = np.array(match_scores, dtype=np.int32).reshape(-1, N)
+        winners_array = np.zeros((len(match_winners), N), dtype=bool)
+        for row, winners in enumerate(match_winners): 
+            winners_array[row, winners] = True
 
         end_time = time.time()
         results = TournamentResults(
             match_results,
             [x.name for x in self.engines],
-            games,
-            wins,
-            totals,
+            games.tolist(),
+            wins.tolist(),
+            totals.tolist(),
             initial_elos,
-            elos,
+            elos.tolist(),
             end_time - start_time,
-            total_time
+            total_time,
+            scores_array,
+            winners_array,
+            np.array([m.run_time for m in match_results], dtype=np.float64)
         )
 
         if verbose_rankings:
@@ -352,46 +468,186 @@ class Tournament:
 
         return results
 
-    def _play_game(self, player_to_engine: list[int]) -> tuple[list[int], list[int], tilewe.Board, list[int]]:
+    def stop_workers(self) -> None: 
+        """
+        Shuts down the worker processes kept between calls to `play`, if any.
+        """
+
+        if self._pool is not None: 
+            self._pool.close()
+            self._pool.join()
+            self._pool = None
+
+    def start_workers(self, n_threads: int) -> multiprocessing.pool.Pool: 
         """
-        An individual game launched by the `play` wrapper.
-        Plays one game given the list of engines and returns results.
+        Returns the pool of worker processes used by `play`, starting it if it's not 
+        already running with `n_threads` workers. Engines are sent to each worker 
+        once when it starts rather than with every game.
 
         Parameters
         ----------
-        player_to_engine : list[int]
-            List of engine indices indicating the players and their turn order
-
-        Returns
-        -------
-        winners : list[int]
-            The list of the engine indices that won the match
-        scores : list[int]
-            The ist of the scores earned for each engine (even those not in this match, as 0)
-        board : tilewe.Board
-            A reference to the game board in it's finished state
-        player_to_engine : list[int]
-            The list of engines that played in the match, indicating turn order
+        n_threads : int
+            The number of worker processes, i.e. simultaneous games
         """
 
-        start_time = time.time()
-        board = tilewe.Board(n_players=len(player_to_engine))
-        try: 
-            engine_to_player = { value: key for key, value in enumerate(player_to_engine) }
-            while not board.finished: 
-                engine = self.engines[player_to_engine[board.current_player]]
-                move = engine.search(board.copy_current_state(), self.move_seconds) 
-                # TODO test legality 
-                board.push(move) 
-            end_time = time.time()
-
-            # put scores back in original engine order 
-            winners = [ player_to_engine[x] for x in board.winners ]
-            scores = [ board.scores[engine_to_player[i]] if i in engine_to_player else 0 for i in range(len(self.engines)) ]
-
-            return winners, scores, board, player_to_engine, end_time - start_time
-        
-        except BaseException: 
-            traceback.print_exc()
-            end_time = time.time()
-            return [], None, None, None, None
+        if n_threads <= 0:
+            raise Exception("Must use at least one thread")
+
+        if self._pool is not None and self._pool_threads != n_threads: 
+            self.stop_workers()
+
+        if self._pool is None: 
+            init_args = (self.engines, self.trust_engines, platform.system() != "Windows", True)
+            self._pool = _worker_context(self.start_method).Pool(
+                n_threads, 
+                initializer=_init_worker, 
+                initargs=init_args, 
+                maxtasksperchild=self.max_tasks_per_child
+            )
+            self._pool_threads = n_threads
+
+        return self._pool
+
+def _worker_context(start_method: str=None) -> multiprocessing.context.BaseContext: 
+    """
+    Returns the multiprocessing context for Tournament workers, see Tournament.
+    """
+
+    context = multiprocessing.get_context(start_method)
+    if start_method == "forkserver": 
+        context.set_forkserver_preload(["tilewe", "tilewe.engine", "tilewe.tournament"])
+    return context
+
+_RANKINGS_HEADER = \
+    f"{'Rank':4} {'Name':24} {'Elo':>5} {'Games':>6} {'Score':>10} {'Avg Score':>10} {'Wins':>6} {'Win Rate':>9}"
+_RANKINGS_ROW = "{:24.24} {:>5.0f} {:>6d} {:>10d} {} {:>6d} {}"
+
+# the most engines shown by the periodic rankings during Tournament.play, the final rankings show all of them
+_RANKINGS_TOP_K = 20
+
+def _format_engine_row(
+    engine: int, 
+    names: list[str], 
+    elos: list[float], 
+    games: list[int], 
+    scores: list[int], 
+    wins: list[int]
+) -> str: 
+    """
+    Returns the row of an engine rankings table for an engine, without its rank.
+    """
+
+    game_count, score, win_count = int(games[engine]), int(scores[engine]), int(wins[engine])
+
+    win_rate = f"{(win_count / game_count * 100):>8.2f}%" if game_count > 0 else f"{'-':>9}"
+    avg_score = f"{(score / game_count):>10.2f}" if game_count > 0 else f"{'-':>10}"
+
+    return _RANKINGS_ROW.format(names[engine], elos[engine], game_count, score, avg_score, win_count, win_rate)
+
+def _format_engine_rankings(
+    ranked_engines: list[int], 
+    names: list[str], 
+    elos: list[float], 
+    games: list[int], 
+    scores: list[int], 
+    wins: list[int]
+) -> list[str]: 
+    """
+    Returns the lines of an engine rankings table, with a row for each engine in `ranked_engines` order.
+    """
+
+    lines = [_RANKINGS_HEADER]
+    for rank, engine in enumerate(ranked_engines): 
+        lines.append(f"{rank:>4d} {_format_engine_row(engine, names, elos, games, scores, wins)}")
+    return lines
+
+# engines and game settings used by the games in a worker process, see _init_worker
+_ENGINES: tuple[Engine, ...] = ()
+_TRUST_ENGINES: bool = True
+
+def _init_worker(engines: tuple[Engine, ...], trust_engines: bool, ignore_sigint: bool, reseed: bool) -> None: 
+    """
+    Initializes a Tournament worker process with the engines and game
+    settings for its games, so they aren't pickled with every game.
+    """
+
+    global _ENGINES, _TRUST_ENGINES
+    _ENGINES = engines
+    _TRUST_ENGINES = trust_engines
+
+    # every worker starts with a copy of the same engine `rng` states, so without a 
+    # tournament seed to reseed them each game they would play the same games
+    if reseed: 
+        for engine in engines: 
+            engine.rng.seed()
+
+    # the parent process handles KeyboardInterrupt and terminates the workers
+    if ignore_sigint: 
+        signal.signal(signal.SIGINT, signal.SIG_IGN)
+
+def _play_game(game: tuple[int | None, float, list[int]]) -> tuple[list[int], list[int], bytes, list[int], float]:
+    """
+    An individual game launched by the `Tournament.play` wrapper in a worker process.
+    Plays one game given the list of engines set by `_init_worker` and returns results.
+
+    Parameters
+    ----------
+    game : tuple[int | None, float, list[int]]
+        The seed for the engines' `rng` (or None to leave them and their state as is), the time control, 
+        and the list of engine indices indicating the players and their turn order
+
+    Returns
+    -------
+    winners : list[int]
+        The list of the engine indices that won the match
+    scores : list[int]
+        The ist of the scores earned for each engine (even those not in this match, as 0)
+    board_data : bytes
+        The game board in it's finished state, encoded by tilewe.Board.to_bytes 
+        since it's much smaller to send back than the board itself
+    player_to_engine : list[int]
+        The list of engines that played in the match, indicating turn order
+    time_sec : float
+        The duration of the match in seconds
+    """
+
+    game_seed, move_seconds, player_to_engine = game
+    if game_seed is not None: 
+        # the moves of seeded games don't depend on which games the engines played before
+        for index, engine in enumerate(_ENGINES): 
+            engine.rng.seed(hash((game_seed, index)))
+            engine.reset()
+
+    start_time = time.time()
+    board = tilewe.Board(n_players=len(player_to_engine))
+    scratch = None
+    try: 
+        while not board.finished: 
+            engine = _ENGINES[player_to_engine[board.current_player]]
+            if _TRUST_ENGINES: 
+                ply = board.ply 
+                move = engine.search(board, move_seconds) 
+                assert board.ply == ply, f"{engine.name} did not restore the board after searching"
+            else: 
+                # untrusted engines search a copy, the same scratch board is reused for each search
+                if scratch is None: 
+                    scratch = board.copy_current_state()
+                else: 
+                    board.copy_current_state_into(scratch)
+                move = engine.search(scratch, move_seconds) 
+            # TODO test legality 
+            board.push(move) 
+        end_time = time.time()
+
+        # put scores back in original engine order 
+        winners = [ player_to_engine[x] for x in board.winners ]
+        scores = [0] * len(_ENGINES)
+        for player, score in enumerate(board.scores): 
+            scores[player_to_engine[player]] = score
+
+        return winners, scores, board.to_bytes(), player_to_engine, end_time - start_time
+    
+    except Exception: 
+        traceback.print_exc()
+        end_time = time.time()
+        return [], None, None, None, None